@@ -1,10 +1,11 @@
 """The ARSO Weather component."""
-from homeassistant.helpers import discovery
-
 DOMAIN = "weather_arso"
 
 async def async_setup(hass, config):
     """Set up the ARSO weather component."""
+    # Imported lazily so the package can be used without Home Assistant
+    from homeassistant.helpers import discovery
+
     await discovery.async_load_platform(hass, "weather", DOMAIN, {}, config)
     return True
 
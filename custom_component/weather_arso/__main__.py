@@ -0,0 +1,246 @@
+"""Standalone bulk export of ARSO observations and forecasts.
+
+Run from the ``custom_component`` directory without Home Assistant::
+
+    python -m weather_arso LJUBL-ANA_BEZIGRAD CELJE --format csv
+"""
+import argparse
+import asyncio
+import csv
+import json
+import logging
+import sys
+import time
+
+from .weather_arso import (
+    FEED_CACHE,
+    get_arso_weather,
+    forecast_region,
+    get_arso_forecast_daily,
+    to_isoformat,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+FIELDNAMES = [
+    "station_id",
+    "region",
+    "kind",
+    "observed_at",
+    "fetched_at",
+    "datetime",
+    "temperature",
+    "native_temperature",
+    "native_templow",
+    "native_dew_point",
+    "condition",
+    "humidity",
+    "wind_speed",
+    "wind_bearing",
+    "pressure",
+    "visibility",
+]
+
+TIMESTAMP_FIELDS = ("observed_at", "fetched_at", "datetime")
+
+def _normalize(kind, data, station_id=None, region=None):
+    record = {key: data.get(key) for key in FIELDNAMES}
+    record["station_id"] = station_id
+    record["region"] = region
+    record["kind"] = kind
+    for key in TIMESTAMP_FIELDS:
+        record[key] = to_isoformat(record[key])
+    return record
+
+async def _fetch_observation(station_id, semaphore):
+    async with semaphore:
+        data = await asyncio.to_thread(get_arso_weather, station_id)
+    return [_normalize("observation", data, station_id=station_id)] if data else []
+
+async def _fetch_forecast(station_id, region, semaphore):
+    async with semaphore:
+        forecasts = await asyncio.to_thread(get_arso_forecast_daily, station_id)
+    return [_normalize("forecast", forecast, region=region) for forecast in forecasts or []]
+
+async def iter_records(station_ids, kinds=("observation",), concurrency=8):
+    """Fetch stations concurrently and yield normalized records as they arrive.
+
+    Forecasts are regional, so each region is fetched once and its records
+    carry the region rather than a station id.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    tasks = []
+    if "observation" in kinds:
+        tasks.extend(
+            asyncio.ensure_future(_fetch_observation(station_id, semaphore))
+            for station_id in station_ids
+        )
+    if "forecast" in kinds:
+        regions = {}
+        for station_id in station_ids:
+            regions.setdefault(forecast_region(station_id), station_id)
+        tasks.extend(
+            asyncio.ensure_future(_fetch_forecast(station_id, region, semaphore))
+            for region, station_id in regions.items()
+        )
+    try:
+        for task in asyncio.as_completed(tasks):
+            try:
+                records = await task
+            except Exception as e:
+                _LOGGER.error(f"Error fetching ARSO data: {e}")
+                continue
+            for record in records:
+                yield record
+    finally:
+        for task in tasks:
+            task.cancel()
+
+class NdjsonWriter:
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, record):
+        self._stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def close(self):
+        self._stream.flush()
+
+class CsvWriter:
+    def __init__(self, stream):
+        self._stream = stream
+        self._writer = csv.DictWriter(stream, fieldnames=FIELDNAMES)
+        self._writer.writeheader()
+
+    def write(self, record):
+        self._writer.writerow(record)
+
+    def close(self):
+        self._stream.flush()
+
+class ColumnarWriter:
+    """Write records as column-oriented JSON row groups.
+
+    Like Parquet row groups, at most ``row_group_size`` records are held in
+    memory; each group is emitted as one line mapping field names to
+    column lists.
+    """
+
+    def __init__(self, stream, row_group_size=1000):
+        self._stream = stream
+        self._row_group_size = row_group_size
+        self._columns = {key: [] for key in FIELDNAMES}
+        self._rows = 0
+
+    def write(self, record):
+        for key in FIELDNAMES:
+            self._columns[key].append(record[key])
+        self._rows += 1
+        if self._rows >= self._row_group_size:
+            self._flush()
+
+    def _flush(self):
+        if not self._rows:
+            return
+        self._stream.write(json.dumps(self._columns, ensure_ascii=False) + "\n")
+        self._stream.flush()
+        self._columns = {key: [] for key in FIELDNAMES}
+        self._rows = 0
+
+    def close(self):
+        self._flush()
+
+WRITERS = {
+    "ndjson": NdjsonWriter,
+    "csv": CsvWriter,
+    "columnar": ColumnarWriter,
+}
+
+def _record_key(record):
+    return (
+        record["kind"],
+        record["station_id"],
+        record["region"],
+        record["observed_at"],
+        record["datetime"],
+    )
+
+def _record_values(record):
+    # fetched_at changes on every fetch even when the data does not
+    return tuple(record[key] for key in FIELDNAMES if key != "fetched_at")
+
+async def export(station_ids, writer, kinds=("observation",), concurrency=8, interval=None):
+    """Stream records for all stations to writer, repeating every interval seconds.
+
+    Records already written unchanged in the previous cycle are skipped, so
+    polling faster than ARSO updates does not produce duplicate rows.
+    """
+    previous = {}
+    while True:
+        started = time.monotonic()
+        current = {}
+        async for record in iter_records(station_ids, kinds, concurrency):
+            key = _record_key(record)
+            values = _record_values(record)
+            current[key] = values
+            if previous.get(key) != values:
+                writer.write(record)
+        previous = current
+        if interval is None:
+            return
+        await asyncio.sleep(max(0, interval - (time.monotonic() - started)))
+
+def _positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="python -m weather_arso",
+        description="Export ARSO observations and forecasts for many stations.",
+    )
+    parser.add_argument("stations", nargs="*", help="ARSO station ids, e.g. LJUBL-ANA_BEZIGRAD")
+    parser.add_argument("--stations-file", help="file with one station id per line")
+    parser.add_argument("--kind", choices=["observation", "forecast", "all"], default="observation")
+    parser.add_argument("--format", choices=sorted(WRITERS), default="ndjson")
+    parser.add_argument("--output", "-o", help="output file (default: stdout)")
+    parser.add_argument("--concurrency", type=_positive_int, default=8)
+    parser.add_argument("--interval", type=float, help="repeat the export every N seconds")
+    parser.add_argument("--cache-size", type=int, help="memory budget for parsed feeds in kilobytes")
+    parser.add_argument("--stats", action="store_true", help="print feed cache statistics to stderr")
+    parser.add_argument("--verbose", "-v", action="store_true")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = _parse_args(argv)
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING)
+
+    station_ids = list(args.stations)
+    if args.stations_file:
+        with open(args.stations_file, encoding="utf-8") as f:
+            station_ids.extend(line.strip() for line in f if line.strip())
+    if not station_ids:
+        station_ids = ["LJUBL-ANA_BEZIGRAD"]
+
+    if args.cache_size is not None:
+        FEED_CACHE.resize(args.cache_size * 1024)
+
+    kinds = ("observation", "forecast") if args.kind == "all" else (args.kind,)
+
+    stream = open(args.output, "w", encoding="utf-8", newline="") if args.output else sys.stdout
+    writer = WRITERS[args.format](stream)
+    try:
+        asyncio.run(export(station_ids, writer, kinds, args.concurrency, args.interval))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        writer.close()
+        if stream is not sys.stdout:
+            stream.close()
+        if args.stats:
+            print(json.dumps(FEED_CACHE.stats()), file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
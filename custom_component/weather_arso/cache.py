@@ -0,0 +1,136 @@
+import logging
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 512 * 1024
+
+def estimate_size(value):
+    """Return an approximate deep size in bytes of parsed records."""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        for key, item in value.items():
+            size += estimate_size(key) + estimate_size(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            size += estimate_size(item)
+    return size
+
+class FeedCache:
+    """LRU cache of extracted feed records with a TTL and a memory budget.
+
+    Only the compact records returned by the extract functions are stored,
+    never the feedparser result, so the footprint stays predictable.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        # Pending fetches by key so concurrent misses share a single fetch
+        self._in_flight = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_fetch(self, key, fetch, ttl, max_age=None):
+        """Return the cached value or call fetch() once for all concurrent callers.
+
+        Callers that arrive while a fetch for the same key is in flight wait
+        for it and share its result, including a failure. max_age=0 bypasses
+        the cache: nothing is read from it and the result is not stored.
+        """
+        with self._lock:
+            value = self._lookup(key, max_age) if max_age != 0 else None
+            if value is not None:
+                self.hits += 1
+                return value
+            future = self._in_flight.get(key)
+            if future is None:
+                future = self._in_flight[key] = Future()
+                owner = True
+                self.misses += 1
+            else:
+                owner = False
+                self.hits += 1
+        if not owner:
+            return future.result()
+
+        try:
+            value = fetch()
+        except BaseException as e:
+            with self._lock:
+                del self._in_flight[key]
+            future.set_exception(e)
+            raise
+        if value is not None and max_age != 0:
+            self.set(key, value, ttl)
+        with self._lock:
+            del self._in_flight[key]
+        future.set_result(value)
+        return value
+
+    def set(self, key, value, ttl):
+        size = estimate_size(value)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if size > self.max_bytes:
+                _LOGGER.debug(f"Not caching {key}: {size} bytes exceeds budget of {self.max_bytes}")
+                return
+            now = time.monotonic()
+            self._entries[key] = (value, size, now, now + ttl)
+            self._size += size
+            self._evict()
+
+    def resize(self, max_bytes):
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "size_bytes": self._size,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else None,
+            }
+
+    def _lookup(self, key, max_age):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, _, stored_at, expires_at = entry
+        now = time.monotonic()
+        if expires_at <= now:
+            self._remove(key)
+            return None
+        if max_age is not None and now - stored_at > max_age:
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _evict(self):
+        # Drop expired entries first, then least recently used ones
+        now = time.monotonic()
+        for key in [key for key, entry in self._entries.items() if entry[3] <= now]:
+            self._remove(key)
+            self.evictions += 1
+        while self._size > self.max_bytes:
+            key = next(iter(self._entries))
+            self._remove(key)
+            self.evictions += 1
+
+    def _remove(self, key):
+        _, size, _, _ = self._entries.pop(key)
+        self._size -= size
@@ -0,0 +1,85 @@
+import asyncio
+import logging
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+# Forecast feeds are refreshed in the background once older than this
+FORECAST_TTL = 1800
+# Minimum delay between fetch attempts after a failed refresh
+RETRY_INTERVAL = 60
+
+class ForecastFeed:
+    """Stale-while-revalidate access to a single forecast feed.
+
+    Cached data is served immediately; once it is older than ``ttl`` one
+    background refresh is started. Concurrent callers share the same
+    in-flight refresh instead of fetching the feed again. ``on_update`` is
+    called after a refresh returns new data. After a failed refresh no new
+    attempt is made for ``retry_interval`` seconds.
+    """
+
+    def __init__(self, hass, fetch, station_id, on_update=None, ttl=FORECAST_TTL,
+                 retry_interval=RETRY_INTERVAL):
+        self._hass = hass
+        self._fetch = fetch
+        self._station_id = station_id
+        self._on_update = on_update
+        self._ttl = ttl
+        self._retry_interval = retry_interval
+        self._refresh_task = None
+        self.data = None
+        # Time of the last successful fetch; only this determines the data age
+        self.fetched_at = None
+        self.last_attempt = None
+
+    @property
+    def age(self):
+        if self.fetched_at is None:
+            return None
+        return time.monotonic() - self.fetched_at
+
+    async def async_get(self, max_age=None):
+        """Return forecast data, refreshing it if older than max_age seconds.
+
+        If the refresh fails, or an earlier one failed within the retry
+        interval, whatever data is held (possibly None) is returned.
+        """
+        age = self.age
+        if age is None or (max_age is not None and age > max_age):
+            refresh = self._async_start_refresh()
+            if refresh is not None:
+                # Shield so a cancelled caller does not cancel the shared refresh
+                return await asyncio.shield(refresh)
+        elif age > self._ttl:
+            self._async_start_refresh()
+        return self.data
+
+    def _async_start_refresh(self):
+        if self._refresh_task is None:
+            if (
+                self.last_attempt is not None
+                and time.monotonic() - self.last_attempt < self._retry_interval
+                and (self.fetched_at is None or self.fetched_at < self.last_attempt)
+            ):
+                return None
+            self._refresh_task = self._hass.async_create_task(self._async_fetch())
+        return self._refresh_task
+
+    async def _async_fetch(self):
+        self.last_attempt = time.monotonic()
+        updated = False
+        try:
+            # max_age=0 skips FEED_CACHE entirely; this feed is the only cache here
+            data = await self._hass.async_add_executor_job(self._fetch, self._station_id, 0)
+            if data is not None:
+                self.data = data
+                self.fetched_at = time.monotonic()
+                updated = True
+        except Exception as e:
+            _LOGGER.error(f"Error fetching ARSO forecast data: {e}")
+        finally:
+            self._refresh_task = None
+        if updated and self._on_update is not None:
+            self._on_update()
+        return self.data
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import voluptuous as vol
 from homeassistant.components.weather import (
@@ -7,21 +8,30 @@ from homeassistant.components.weather import (
 )
 from homeassistant.const import CONF_NAME
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from .forecast_feed import FORECAST_TTL, ForecastFeed
 from .weather_arso import (
+    FEED_CACHE,
     get_arso_weather,
     get_arso_forecast_daily,
     get_arso_forecast_hourly,
     get_arso_forecast_twice_daily,
+    to_isoformat,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+CONF_CACHE_SIZE = "cache_size"
+
 PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend({
     vol.Optional(CONF_NAME, default="ARSO Weather"): str,
+    # Memory budget for parsed feed records, in kilobytes
+    vol.Optional(CONF_CACHE_SIZE): vol.All(int, vol.Range(min=0)),
 })
 
 async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
     name = config.get(CONF_NAME)
+    if CONF_CACHE_SIZE in config:
+        FEED_CACHE.resize(config[CONF_CACHE_SIZE] * 1024)
     station_id = "LJUBL-ANA_BEZIGRAD" 
     async_add_entities([ARSOWeather(hass, station_id, name)], True)
 
@@ -38,9 +48,19 @@ class ARSOWeather(WeatherEntity):
         self._state = None
         self._attributes = {}
         self._session = async_get_clientsession(hass)
-        self._forecast_daily = None
-        self._forecast_hourly = None
-        self._forecast_twice_daily = None
+        self._added = False
+        self._forecast_daily = ForecastFeed(
+            hass, get_arso_forecast_daily, station_id,
+            lambda: self._async_forecast_updated("daily"),
+        )
+        self._forecast_hourly = ForecastFeed(
+            hass, get_arso_forecast_hourly, station_id,
+            lambda: self._async_forecast_updated("hourly"),
+        )
+        self._forecast_twice_daily = ForecastFeed(
+            hass, get_arso_forecast_twice_daily, station_id,
+            lambda: self._async_forecast_updated("twice_daily"),
+        )
 
     @property
     def name(self):
@@ -86,9 +106,23 @@ class ARSOWeather(WeatherEntity):
     def visibility(self):
         return self._attributes.get("visibility")
 
+    @property
+    def extra_state_attributes(self):
+        return {
+            "observed_at": to_isoformat(self._attributes.get("observed_at")),
+        }
+
     @property
     def forecast(self):
-        return self._forecast_daily
+        return _format_forecast(self._forecast_daily.data)
+
+    async def async_added_to_hass(self):
+        self._added = True
+
+    def _async_forecast_updated(self, forecast_type):
+        """Push a refreshed forecast to frontend and service subscribers."""
+        if self._added:
+            self.hass.async_create_task(self.async_update_listeners((forecast_type,)))
 
     async def async_update(self):
         """Fetch new state data for the sensor."""
@@ -98,18 +132,32 @@ class ARSOWeather(WeatherEntity):
                 _LOGGER.debug(f"Fetched ARSO weather data: {data}")
                 self._state = data.get("condition")
                 self._attributes.update(data)
-                
-            self._forecast_daily = await self.hass.async_add_executor_job(get_arso_forecast_daily, self._station_id)
-            self._forecast_hourly = await self.hass.async_add_executor_job(get_arso_forecast_hourly, self._station_id)
-            self._forecast_twice_daily = await self.hass.async_add_executor_job(get_arso_forecast_twice_daily, self._station_id)
+
+            await asyncio.gather(
+                self._forecast_daily.async_get(max_age=FORECAST_TTL),
+                self._forecast_hourly.async_get(max_age=FORECAST_TTL),
+                self._forecast_twice_daily.async_get(max_age=FORECAST_TTL),
+            )
+            _LOGGER.debug(f"ARSO feed cache stats: {FEED_CACHE.stats()}")
         except Exception as e:
             _LOGGER.error(f"Error fetching ARSO weather data: {e}")
 
-    async def async_forecast_daily(self):
-        return self._forecast_daily
-
-    async def async_forecast_hourly(self):
-        return self._forecast_hourly
-
-    async def async_forecast_twice_daily(self):
-        return self._forecast_twice_daily
\ No newline at end of file
+    # Home Assistant calls these without arguments, so weather.get_forecasts
+    # always gets stale-while-revalidate data; max_age is for internal callers.
+    async def async_forecast_daily(self, max_age=None):
+        return _format_forecast(await self._forecast_daily.async_get(max_age))
+
+    async def async_forecast_hourly(self, max_age=None):
+        return _format_forecast(await self._forecast_hourly.async_get(max_age))
+
+    async def async_forecast_twice_daily(self, max_age=None):
+        return _format_forecast(await self._forecast_twice_daily.async_get(max_age))
+
+def _format_forecast(forecasts):
+    """Convert internal epoch timestamps to the ISO strings HA expects."""
+    if forecasts is None:
+        return None
+    return [
+        {**forecast, "datetime": to_isoformat(forecast["datetime"])}
+        for forecast in forecasts
+    ]
@@ -1,9 +1,29 @@
+import calendar
 import feedparser
 import logging
-from datetime import datetime
+import re
+import time
+from datetime import date, datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+
+from .cache import FeedCache
 
 _LOGGER = logging.getLogger(__name__)
 
+# Parsed records are reused for this many seconds before the feed is fetched again
+OBSERVATION_CACHE_TTL = 300
+FORECAST_CACHE_TTL = 600
+
+FEED_CACHE = FeedCache()
+
+# Only the central Slovenia regional forecast is used for now, whatever the station
+FORECAST_REGION = "OSREDNJESLOVENSKA"
+
+# ARSO publishes Slovenian local time
+ARSO_TIMEZONE = ZoneInfo("Europe/Ljubljana")
+
 CONDITION_MAP = {
     "Jasno.": "sunny",
     "Pretežno jasno.": "sunny",
@@ -33,9 +53,30 @@ WIND_BEARINGS = {
     # Add other mappings as necessary
 }
 
-def get_arso_weather(station_id="LJUBL-ANA_BEZIGRAD"):
+# Slovenian weekday names (nominative and accusative) to date.weekday()
+WEEKDAYS = {
+    "ponedeljek": 0,
+    "torek": 1,
+    "sreda": 2,
+    "sredo": 2,
+    "četrtek": 3,
+    "petek": 4,
+    "sobota": 5,
+    "soboto": 5,
+    "nedelja": 6,
+    "nedeljo": 6,
+}
+
+DATE_RE = re.compile(r"\b(\d{1,2})\.\s*(\d{1,2})\.\s*(\d{4})\b")
+WEEKDAY_RE = re.compile(r"\b(" + "|".join(WEEKDAYS) + r")\b", re.IGNORECASE)
+
+def get_arso_weather(station_id="LJUBL-ANA_BEZIGRAD", max_age=None):
     url = f"https://meteo.arso.gov.si/uploads/probase/www/observ/surface/text/sl/observation_{station_id}_latest.rss"
+    return FEED_CACHE.get_or_fetch(
+        url, lambda: _fetch_arso_weather(url), OBSERVATION_CACHE_TTL, max_age
+    )
 
+def _fetch_arso_weather(url):
     try:
         feed = feedparser.parse(url)
     except Exception as e:
@@ -57,11 +98,87 @@ def get_arso_weather(station_id="LJUBL-ANA_BEZIGRAD"):
         "pressure": _extract_pressure(entry.summary),
         "visibility": _extract_visibility(entry.summary),
         "native_dew_point": _extract_dew_point(entry.summary),
-        "updated_at": datetime.now().isoformat(),
+        "observed_at": _entry_timestamp(entry),
+        "fetched_at": int(time.time()),
     }
 
     return data
 
+# Timestamps are kept as UTC epoch seconds internally and only turned into
+# ISO strings at the Home Assistant boundary (see to_isoformat).
+@lru_cache(maxsize=256)
+def _parse_timestamp(value):
+    try:
+        parsed = parsedate_to_datetime(value)
+        if parsed.tzinfo is None and value.rstrip().endswith("-0000"):
+            # RFC 2822 -0000 is UTC, but email.utils returns it naive
+            parsed = parsed.replace(tzinfo=timezone.utc)
+    except (TypeError, ValueError, IndexError):
+        try:
+            parsed = datetime.fromisoformat(value)
+        except (TypeError, ValueError):
+            _LOGGER.debug(f"Unable to parse timestamp: {value}")
+            return None
+    if parsed.tzinfo is None:
+        # No offset or a zone name email.utils doesn't know (e.g. CEST)
+        parsed = parsed.replace(tzinfo=ARSO_TIMEZONE)
+    return int(parsed.timestamp())
+
+def _entry_timestamp(entry):
+    for key in ("published", "updated"):
+        value = entry.get(key)
+        if value:
+            timestamp = _parse_timestamp(value)
+            if timestamp is not None:
+                return timestamp
+    # feedparser normalizes *_parsed fields to UTC struct_time
+    for key in ("published_parsed", "updated_parsed"):
+        value = entry.get(key)
+        if value:
+            return calendar.timegm(value)
+    return None
+
+@lru_cache(maxsize=256)
+def _parse_validity_date(text, published):
+    """Return the day a forecast is valid for, from a date or weekday in text."""
+    match = DATE_RE.search(text)
+    if match:
+        day, month, year = (int(group) for group in match.groups())
+        try:
+            return date(year, month, day)
+        except ValueError:
+            return None
+    match = WEEKDAY_RE.search(text)
+    if match and published is not None:
+        # Weekday names refer to the first such day on or after publication
+        published_day = datetime.fromtimestamp(published, tz=ARSO_TIMEZONE).date()
+        offset = (WEEKDAYS[match.group(1).lower()] - published_day.weekday()) % 7
+        return published_day + timedelta(days=offset)
+    return None
+
+def _forecast_timestamp(entry):
+    """Return the start of the forecast's validity day (local time) as UTC epoch."""
+    published = _entry_timestamp(entry)
+    for text in (entry.get("title", ""), entry.get("summary", "")):
+        valid_on = _parse_validity_date(text, published)
+        if valid_on is not None:
+            start = datetime(valid_on.year, valid_on.month, valid_on.day, tzinfo=ARSO_TIMEZONE)
+            return int(start.timestamp())
+    return None
+
+def to_isoformat(timestamp):
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
+
+def data_age(timestamp, now=None):
+    """Return the age of a UTC epoch timestamp in seconds, or None if unknown."""
+    if timestamp is None:
+        return None
+    if now is None:
+        now = time.time()
+    return max(0, int(now - timestamp))
+
 def _extract_temperature(summary):
     try:
         _LOGGER.debug(f"Extracting temperature from summary: {summary}")
@@ -171,9 +288,17 @@ def _extract_dew_point(summary):
         _LOGGER.error(f"Error extracting dew point: {e}, summary: {summary}")
         return None
 
-def get_arso_forecast_daily(station_id="LJUBL-ANA_BEZIGRAD"):
-    url = "https://meteo.arso.gov.si/uploads/probase/www/fproduct/text/sl/fcast_SI_OSREDNJESLOVENSKA_latest.rss"
+def forecast_region(station_id):
+    return FORECAST_REGION
 
+def get_arso_forecast_daily(station_id="LJUBL-ANA_BEZIGRAD", max_age=None):
+    region = forecast_region(station_id)
+    url = f"https://meteo.arso.gov.si/uploads/probase/www/fproduct/text/sl/fcast_SI_{region}_latest.rss"
+    return FEED_CACHE.get_or_fetch(
+        url, lambda: _fetch_arso_forecast_daily(url), FORECAST_CACHE_TTL, max_age
+    )
+
+def _fetch_arso_forecast_daily(url):
     try:
         feed = feedparser.parse(url)
     except Exception as e:
@@ -194,8 +319,12 @@ def get_arso_forecast_daily(station_id="LJUBL-ANA_BEZIGRAD"):
 
 def _parse_forecast_entry(entry):
     try:
+        timestamp = _forecast_timestamp(entry)
+        if timestamp is None:
+            _LOGGER.error(f"Forecast entry has no validity date: {entry.get('title')}")
+            return None
         forecast = {
-            "datetime": datetime(*entry.published_parsed[:6]).isoformat(),
+            "datetime": timestamp,
             "native_temperature": _extract_float(entry.summary, "max temperature: ", "°C"),
             "native_templow": _extract_float(entry.summary, "min temperature: ", "°C"),
             "condition": _extract_condition(entry.summary),
@@ -214,10 +343,10 @@ def _extract_float(text, prefix, suffix):
     except (ValueError, IndexError):
         return None
 
-def get_arso_forecast_hourly(station_id="LJUBL-ANA_BEZIGRAD"):
+def get_arso_forecast_hourly(station_id="LJUBL-ANA_BEZIGRAD", max_age=None):
     # Implement similarly to daily forecast by fetching hourly data
     pass
 
-def get_arso_forecast_twice_daily(station_id="LJUBL-ANA_BEZIGRAD"):
+def get_arso_forecast_twice_daily(station_id="LJUBL-ANA_BEZIGRAD", max_age=None):
     # Implement similarly to daily forecast by fetching twice daily data
     pass
\ No newline at end of file
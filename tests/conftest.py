@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The integration lives in custom_component/ and is imported as a package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "custom_component"))
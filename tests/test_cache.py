@@ -0,0 +1,131 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from weather_arso.cache import FeedCache, estimate_size
+
+class Fetcher:
+    def __init__(self, result=None, delay=0.0):
+        self.calls = 0
+        self._result = result
+        self._delay = delay
+        self._lock = threading.Lock()
+        self._event = threading.Event()
+
+    def __call__(self):
+        self._event.wait(self._delay)
+        with self._lock:
+            self.calls += 1
+            if isinstance(self._result, Exception):
+                raise self._result
+            return self._result if self._result is not None else [self.calls]
+
+def test_hit_after_fetch():
+    cache = FeedCache()
+    fetch = Fetcher()
+    assert cache.get_or_fetch("a", fetch, ttl=60) == [1]
+    assert cache.get_or_fetch("a", fetch, ttl=60) == [1]
+    assert fetch.calls == 1
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+    assert stats["size_bytes"] == estimate_size([1])
+
+def test_ttl_expiry():
+    cache = FeedCache()
+    fetch = Fetcher()
+    cache.get_or_fetch("a", fetch, ttl=0.01)
+    time.sleep(0.02)
+    assert cache.get_or_fetch("a", fetch, ttl=0.01) == [2]
+
+def test_max_age():
+    cache = FeedCache()
+    fetch = Fetcher()
+    cache.get_or_fetch("a", fetch, ttl=60)
+    time.sleep(0.02)
+    assert cache.get_or_fetch("a", fetch, ttl=60, max_age=60) == [1]
+    assert cache.get_or_fetch("a", fetch, ttl=60, max_age=0.01) == [2]
+
+def test_max_age_zero_bypasses_cache():
+    cache = FeedCache()
+    fetch = Fetcher()
+    assert cache.get_or_fetch("a", fetch, ttl=60, max_age=0) == [1]
+    assert cache.stats()["entries"] == 0
+    assert cache.get_or_fetch("a", fetch, ttl=60) == [2]
+
+def test_lru_eviction():
+    value_size = estimate_size(["x"])
+    cache = FeedCache(max_bytes=value_size * 2)
+    for key in "abc":
+        cache.get_or_fetch(key, Fetcher(result=["x"]), ttl=60)
+    stats = cache.stats()
+    assert (stats["entries"], stats["evictions"]) == (2, 1)
+    # "a" was least recently used and is fetched again
+    fetch = Fetcher(result=["x"])
+    cache.get_or_fetch("a", fetch, ttl=60)
+    assert fetch.calls == 1
+
+def test_lru_order_follows_access():
+    value_size = estimate_size(["x"])
+    cache = FeedCache(max_bytes=value_size * 2)
+    cache.get_or_fetch("a", Fetcher(result=["x"]), ttl=60)
+    cache.get_or_fetch("b", Fetcher(result=["x"]), ttl=60)
+    cache.get_or_fetch("a", Fetcher(result=["x"]), ttl=60)
+    cache.get_or_fetch("c", Fetcher(result=["x"]), ttl=60)
+    fetch = Fetcher(result=["x"])
+    cache.get_or_fetch("a", fetch, ttl=60)
+    assert fetch.calls == 0
+
+def test_oversized_value_not_stored():
+    cache = FeedCache(max_bytes=10)
+    cache.get_or_fetch("a", Fetcher(result=["x" * 100]), ttl=60)
+    assert cache.stats()["entries"] == 0
+
+def test_resize_evicts():
+    cache = FeedCache()
+    for key in "abc":
+        cache.get_or_fetch(key, Fetcher(result=["x"]), ttl=60)
+    cache.resize(estimate_size(["x"]))
+    stats = cache.stats()
+    assert (stats["entries"], stats["max_bytes"]) == (1, estimate_size(["x"]))
+
+def test_concurrent_misses_share_one_fetch():
+    cache = FeedCache()
+    fetch = Fetcher(delay=0.05)
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(lambda _: cache.get_or_fetch("a", fetch, ttl=60), range(8)))
+    assert results == [[1]] * 8
+    assert fetch.calls == 1
+
+def test_concurrent_failures_are_shared():
+    cache = FeedCache()
+    calls = []
+
+    def fetch():
+        time.sleep(0.05)
+        calls.append(1)
+        return None
+
+    with ThreadPoolExecutor(5) as executor:
+        results = list(executor.map(lambda _: cache.get_or_fetch("a", fetch, ttl=60), range(5)))
+    assert results == [None] * 5
+    assert len(calls) == 1
+
+def test_concurrent_exceptions_are_shared():
+    cache = FeedCache()
+    fetch = Fetcher(result=RuntimeError("boom"), delay=0.05)
+
+    def call(_):
+        try:
+            cache.get_or_fetch("a", fetch, ttl=60)
+        except RuntimeError as e:
+            return str(e)
+
+    with ThreadPoolExecutor(5) as executor:
+        assert list(executor.map(call, range(5))) == ["boom"] * 5
+    assert fetch.calls == 1
+    # A later call tries again
+    with pytest.raises(RuntimeError):
+        cache.get_or_fetch("a", fetch, ttl=60)
+    assert fetch.calls == 2
@@ -0,0 +1,81 @@
+import asyncio
+import csv
+import io
+import json
+
+import pytest
+
+pytest.importorskip("feedparser")
+
+from weather_arso import __main__ as cli
+
+def _record(**values):
+    record = {key: None for key in cli.FIELDNAMES}
+    record.update(values)
+    return record
+
+def test_ndjson_writer():
+    stream = io.StringIO()
+    writer = cli.NdjsonWriter(stream)
+    writer.write(_record(station_id="A", condition="sončno"))
+    writer.write(_record(station_id="B"))
+    writer.close()
+    lines = stream.getvalue().splitlines()
+    assert [json.loads(line)["station_id"] for line in lines] == ["A", "B"]
+    assert "sončno" in lines[0]
+
+def test_csv_writer():
+    stream = io.StringIO()
+    writer = cli.CsvWriter(stream)
+    writer.write(_record(station_id="A", temperature=12.0))
+    writer.close()
+    rows = list(csv.DictReader(io.StringIO(stream.getvalue())))
+    assert list(rows[0]) == cli.FIELDNAMES
+    assert rows[0]["temperature"] == "12.0"
+
+def test_columnar_writer_flushes_row_groups():
+    stream = io.StringIO()
+    writer = cli.ColumnarWriter(stream, row_group_size=2)
+    for station_id in "ABC":
+        writer.write(_record(station_id=station_id))
+    assert len(stream.getvalue().splitlines()) == 1
+    writer.close()
+    groups = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [group["station_id"] for group in groups] == [["A", "B"], ["C"]]
+
+def test_concurrency_must_be_positive():
+    with pytest.raises(SystemExit):
+        cli._parse_args(["--concurrency", "0"])
+    assert cli._parse_args(["--concurrency", "3"]).concurrency == 3
+
+class ListWriter:
+    def __init__(self):
+        self.records = []
+
+    def write(self, record):
+        self.records.append(record)
+
+def test_export_skips_records_unchanged_since_last_cycle(monkeypatch):
+    cycles = iter([
+        [_record(kind="observation", station_id="A", observed_at="t1", fetched_at="f1")],
+        [_record(kind="observation", station_id="A", observed_at="t1", fetched_at="f2")],
+        [_record(kind="observation", station_id="A", observed_at="t2", fetched_at="f3")],
+    ])
+
+    async def fake_iter_records(station_ids, kinds, concurrency):
+        for record in next(cycles):
+            yield record
+
+    sleeps = []
+
+    async def stop_after_three(delay):
+        sleeps.append(delay)
+        if len(sleeps) == 3:
+            raise asyncio.CancelledError
+
+    monkeypatch.setattr(cli, "iter_records", fake_iter_records)
+    monkeypatch.setattr(cli.asyncio, "sleep", stop_after_three)
+    writer = ListWriter()
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(cli.export(["A"], writer, interval=1))
+    assert [record["observed_at"] for record in writer.records] == ["t1", "t2"]
@@ -0,0 +1,102 @@
+import asyncio
+import threading
+
+from weather_arso.forecast_feed import ForecastFeed
+
+class FakeHass:
+    def async_create_task(self, coro):
+        return asyncio.get_running_loop().create_task(coro)
+
+    async def async_add_executor_job(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+class Fetcher:
+    def __init__(self, results=None, delay=0.02):
+        self.calls = []
+        self._results = results
+        self._delay = delay
+        self._event = threading.Event()
+
+    def __call__(self, station_id, max_age=None):
+        self._event.wait(self._delay)
+        self.calls.append((station_id, max_age))
+        if self._results is None:
+            return [len(self.calls)]
+        result = self._results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+def test_concurrent_callers_share_one_refresh():
+    fetch = Fetcher()
+    feed = ForecastFeed(FakeHass(), fetch, "X")
+
+    async def run():
+        return await asyncio.gather(*[feed.async_get() for _ in range(5)])
+
+    assert asyncio.run(run()) == [[1]] * 5
+    # Forced refreshes bypass the shared feed cache
+    assert fetch.calls == [("X", 0)]
+
+def test_stale_data_served_while_refreshing():
+    fetch = Fetcher()
+    updates = []
+    feed = ForecastFeed(FakeHass(), fetch, "X", on_update=lambda: updates.append(feed.data), ttl=0.05)
+
+    async def run():
+        assert await feed.async_get() == [1]
+        await asyncio.sleep(0.06)
+        # Stale: served immediately, refreshed in the background
+        assert await feed.async_get() == [1]
+        await asyncio.sleep(0.05)
+        assert await feed.async_get() == [2]
+
+    asyncio.run(run())
+    assert updates == [[1], [2]]
+
+def test_max_age_forces_refresh():
+    fetch = Fetcher()
+    feed = ForecastFeed(FakeHass(), fetch, "X")
+
+    async def run():
+        await feed.async_get()
+        await asyncio.sleep(0.01)
+        return await feed.async_get(max_age=0)
+
+    assert asyncio.run(run()) == [2]
+
+def test_failed_refresh_keeps_age_and_backs_off():
+    fetch = Fetcher(results=[[1], None, RuntimeError("boom"), [2]])
+    updates = []
+    feed = ForecastFeed(
+        FakeHass(), fetch, "X", on_update=lambda: updates.append(feed.data), retry_interval=0.05
+    )
+
+    async def run():
+        assert await feed.async_get() == [1]
+        fetched_at = feed.fetched_at
+        await asyncio.sleep(0.01)
+        # Failure returns the old data without pretending it is fresh
+        assert await feed.async_get(max_age=0) == [1]
+        assert feed.fetched_at == fetched_at
+        # Within the retry interval no new fetch is started
+        assert await feed.async_get(max_age=0) == [1]
+        assert len(fetch.calls) == 2
+        await asyncio.sleep(0.06)
+        assert await feed.async_get(max_age=0) == [1]
+        await asyncio.sleep(0.06)
+        assert await feed.async_get(max_age=0) == [2]
+
+    asyncio.run(run())
+    assert len(fetch.calls) == 4
+    assert updates == [[1], [2]]
+
+def test_on_update_runs_after_refresh_is_cleared():
+    fetch = Fetcher()
+    seen = []
+    feed = ForecastFeed(
+        FakeHass(), fetch, "X",
+        on_update=lambda: seen.append((feed._refresh_task, feed.fetched_at is not None)),
+    )
+    asyncio.run(feed.async_get())
+    assert seen == [(None, True)]
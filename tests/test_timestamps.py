@@ -0,0 +1,56 @@
+import pytest
+
+pytest.importorskip("feedparser")
+
+from weather_arso.weather_arso import (
+    _forecast_timestamp,
+    _parse_timestamp,
+    data_age,
+    to_isoformat,
+)
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("Mon, 19 Oct 2026 14:30:00 +0200", "2026-10-19T12:30:00+00:00"),
+        ("Mon, 19 Oct 2026 14:30:00 GMT", "2026-10-19T14:30:00+00:00"),
+        ("Mon, 19 Oct 2026 14:30:00 -0000", "2026-10-19T14:30:00+00:00"),
+        # Unknown zone names and naive ISO strings are Slovenian local time
+        ("Mon, 19 Oct 2026 14:30:00 CEST", "2026-10-19T12:30:00+00:00"),
+        ("Mon, 19 Jan 2026 14:30:00 CET", "2026-01-19T13:30:00+00:00"),
+        ("2026-10-19T14:30:00", "2026-10-19T12:30:00+00:00"),
+        ("2026-10-19T14:30:00+00:00", "2026-10-19T14:30:00+00:00"),
+    ],
+)
+def test_parse_timestamp(value, expected):
+    assert to_isoformat(_parse_timestamp(value)) == expected
+
+def test_parse_timestamp_garbage():
+    assert _parse_timestamp("not a date") is None
+
+def test_to_isoformat_none():
+    assert to_isoformat(None) is None
+
+def test_data_age():
+    assert data_age(100, now=160) == 60
+    assert data_age(200, now=160) == 0
+    assert data_age(None) is None
+
+def test_forecast_timestamp_from_date_in_title():
+    entry = {"title": "Osrednja Slovenija: 21.10.2026", "published": "Mon, 19 Oct 2026 06:00:00 +0200"}
+    assert to_isoformat(_forecast_timestamp(entry)) == "2026-10-20T22:00:00+00:00"
+
+def test_forecast_timestamp_from_weekday():
+    entry = {"title": "Napoved za sredo", "published": "Mon, 19 Oct 2026 06:00:00 +0200"}
+    assert to_isoformat(_forecast_timestamp(entry)) == "2026-10-20T22:00:00+00:00"
+
+def test_forecast_timestamp_is_not_publication_time():
+    published = "Mon, 19 Oct 2026 06:00:00 +0200"
+    days = [
+        _forecast_timestamp({"title": f"Napoved za {day}", "published": published})
+        for day in ("ponedeljek", "torek", "sredo")
+    ]
+    assert len(set(days)) == 3
+
+def test_forecast_timestamp_missing():
+    assert _forecast_timestamp({"title": "Napoved", "published": "Mon, 19 Oct 2026 06:00:00 +0200"}) is None